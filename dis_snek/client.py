@@ -1,14 +1,15 @@
 import asyncio
 import datetime
+import functools
 import importlib.util
 import inspect
 import logging
-import re
 import sys
 import traceback
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, List, Optional, Union, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union, Awaitable
 
 import aiohttp
+import attr
 
 from dis_snek.const import logger_name, GLOBAL_SCOPE, MISSING, MENTION_PREFIX
 from dis_snek.errors import (
@@ -68,11 +69,66 @@ from dis_snek.utils.input_utils import get_first_word, get_args
 from dis_snek.utils.misc_utils import wrap_partial
 
 if TYPE_CHECKING:
-    from dis_snek.models import Snowflake_Type, TYPE_ALL_CHANNEL
+    from dis_snek.models import Snowflake_Type, TYPE_ALL_CHANNEL, BaseChannel, Role
     from asyncio import Future
 
 log = logging.getLogger(logger_name)
 
+_cache_config_names = frozenset(f.name for f in attr.fields(GlobalCache) if not f.name.startswith("_"))
+"""The names of the caches that can be configured through `Snake.__init__`"""
+
+
+def _resolve_user(cache: GlobalCache, guild_id: int, value: int) -> Optional[User]:
+    return cache.member_cache.get((guild_id, value)) or cache.user_cache.get(value)
+
+
+def _resolve_channel(cache: GlobalCache, guild_id: int, value: int) -> Optional["BaseChannel"]:
+    return cache.channel_cache.get(value)
+
+
+def _resolve_role(cache: GlobalCache, guild_id: int, value: int) -> Optional["Role"]:
+    return cache.role_cache.get(value)
+
+
+def _resolve_mentionable(cache: GlobalCache, guild_id: int, value: int) -> Optional[Union[User, "Role"]]:
+    return _resolve_user(cache, guild_id, value) or _resolve_role(cache, guild_id, value)
+
+
+_option_resolvers: Dict[OptionTypes, Callable[[GlobalCache, int, int], Optional[Any]]] = {
+    OptionTypes.USER: _resolve_user,
+    OptionTypes.CHANNEL: _resolve_channel,
+    OptionTypes.ROLE: _resolve_role,
+    OptionTypes.MENTIONABLE: _resolve_mentionable,
+}
+"""Resolvers that find the cached object an option's value refers to, by option type. Ids are passed as snowflakes"""
+
+_status_by_name: Dict[str, Status] = dict(Status.__members__)
+"""Every status, keyed by its upper-case name (aliases included)"""
+
+_command_interaction_types = frozenset(
+    {InteractionTypes.PING, InteractionTypes.APPLICATION_COMMAND, InteractionTypes.AUTOCOMPLETE}
+)
+"""Interaction types that are dispatched to a registered application command"""
+
+_sub_command_types = frozenset({OptionTypes.SUB_COMMAND, OptionTypes.SUB_COMMAND_GROUP})
+"""Option types that nest a sub command rather than carrying a value"""
+
+
+async def _run_listener(coro, event, args: tuple, kwargs: dict, on_error: Callable[..., Coroutine]) -> None:
+    """Run a listener, passing any exception it raises to `on_error`"""
+    try:
+        await coro(*args, **kwargs)
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        await on_error(event, e)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_extension_name(name: str, package: Optional[str]) -> str:
+    """Resolve a (possibly relative) extension name to its absolute module name"""
+    return importlib.util.resolve_name(name, package)
+
 
 class Snake(
     ChannelEvents,
@@ -169,10 +225,10 @@ class Snake(
         """The DateTime the bot started at"""
         self.enforce_interaction_perms = enforce_interaction_perms
 
-        self._mention_reg = MISSING
+        self._mention_prefixes: tuple[str, str] = MISSING
 
         # caches
-        self.cache: GlobalCache = GlobalCache(self, **{k: v for k, v in kwargs.items() if hasattr(GlobalCache, k)})
+        self.cache: GlobalCache = GlobalCache(self, **{k: v for k, v in kwargs.items() if k in _cache_config_names})
         # these store the last sent presence data for change_presence
         self._status: Status = status
         if isinstance(activity, str):
@@ -190,12 +246,15 @@ class Snake(
         self.interactions: Dict["Snowflake_Type", Dict[str, InteractionCommand]] = {}
         """A dictionary of registered application commands: `{cmd_id: command}`"""
         self._component_callbacks: Dict[str, Callable[..., Coroutine]] = {}
-        self._interaction_scopes: Dict["Snowflake_Type", "Snowflake_Type"] = {}
+        self._interaction_lookup: Dict[str, Tuple["Snowflake_Type", Dict[str, InteractionCommand]]] = {}
+        """The scope of each cmd_id and its commands: `{cmd_id: (scope, {resolved_name: command})}`"""
         self.__extensions = {}
         self.scales = {}
         """A dictionary of mounted Scales"""
-        self.listeners: Dict[str, List] = {}
+        self._scales_by_extension: Dict[str, Scale] = {}
+        self.listeners: Dict[str, Tuple[Listener, ...]] = {}
         self.waits: Dict[str, List] = {}
+        self._tasks: List[Task] = []
 
     @property
     def is_closed(self) -> bool:
@@ -247,9 +306,11 @@ class Snake(
     def application_commands(self):
         """a list of all application commands registered within the bot"""
         commands = []
-        for scope in self.interactions.keys():
-            for cmd in self.interactions[scope].values():
-                if cmd not in commands:
+        seen = set()  # commands aren't hashable, so track them by id
+        for scope in self.interactions.values():
+            for cmd in scope.values():
+                if id(cmd) not in seen:
+                    seen.add(id(cmd))
                     commands.append(cmd)
 
         return commands
@@ -285,7 +346,7 @@ class Snake(
         self._user = SnakeBotUser.from_dict(me, self)
         self.cache.place_user_data(me)
         self._app = Application.from_dict(await self.http.get_current_bot_information(), self)
-        self._mention_reg = re.compile(fr"^(<@!?{self.user.id}*>\s)")
+        self._mention_prefixes = (f"<@{self.user.id}>", f"<@!{self.user.id}>")
         self.start_time = datetime.datetime.now()
         self.dispatch(events.Login())
         await self._ws_connect()
@@ -351,18 +412,7 @@ class Snake(
             await asyncio.sleep(5)
 
     def _queue_task(self, coro, event, *args, **kwargs):
-        async def _async_wrap(_coro, _event, *_args, **_kwargs):
-            try:
-                if len(_event.__attrs_attrs__) == 1:
-                    await _coro()
-                else:
-                    await _coro(_event, *_args, **_kwargs)
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                await self.on_error(event, e)
-
-        wrapped = _async_wrap(coro, event, *args, **kwargs)
+        wrapped = _run_listener(coro, event, args, kwargs, self.on_error)
 
         return asyncio.create_task(wrapped, name=f"snake:: {event.resolved_name}")
 
@@ -394,13 +444,10 @@ class Snake(
         Args:
             ctx: The context of the command that was called
         """
-        if isinstance(ctx, MessageContext):
-            symbol = "@"
-        elif isinstance(ctx, InteractionContext):
-            symbol = "/"
-        else:
-            symbol = "?"  # likely custom context
-        log.info(f"Command Called: {symbol}{ctx.invoked_name} with {ctx.args = } | {ctx.kwargs = }")
+        symbol = getattr(ctx, "_log_symbol", "?")  # contexts that don't subclass `Context` are likely custom
+        log.info(
+            "Command Called: %s%s with ctx.args = %r | ctx.kwargs = %r", symbol, ctx.invoked_name, ctx.args, ctx.kwargs
+        )
 
     async def on_component_error(self, ctx: ComponentContext, error: Exception, *args, **kwargs) -> None:
         """
@@ -420,8 +467,13 @@ class Snake(
         Args:
             ctx: The context of the component that was called
         """
-        symbol = "¢"
-        log.info(f"Component Called: {symbol}{ctx.invoked_name} with {ctx.args = } | {ctx.kwargs = }")
+        log.info(
+            "Component Called: %s%s with ctx.args = %r | ctx.kwargs = %r",
+            getattr(ctx, "_log_symbol", "¢"),
+            ctx.invoked_name,
+            ctx.args,
+            ctx.kwargs,
+        )
 
     async def on_autocomplete_error(self, ctx: AutocompleteContext, error: Exception, *args, **kwargs) -> None:
         """
@@ -443,9 +495,13 @@ class Snake(
         Args:
             ctx: The context of the command that was called
         """
-
-        symbol = "$"
-        log.info(f"Autocomplete Called: {symbol}{ctx.invoked_name} with {ctx.args = } | {ctx.kwargs = }")
+        log.info(
+            "Autocomplete Called: %s%s with ctx.args = %r | ctx.kwargs = %r",
+            getattr(ctx, "_log_symbol", "$"),
+            ctx.invoked_name,
+            ctx.args,
+            ctx.kwargs,
+        )
 
     @listen()
     async def _on_websocket_ready(self, event: events.RawGatewayEvent) -> None:
@@ -459,7 +515,8 @@ class Snake(
         expected_guilds = set(to_snowflake(guild["id"]) for guild in data["guilds"])
         self._user._add_guilds(expected_guilds)
 
-        while True:
+        # wait until all guilds are cached, the timeout restarts every time a guild arrives
+        while len(self.cache.guild_cache) != len(expected_guilds):
             try:  # wait to let guilds cache
                 await asyncio.wait_for(self._guild_event.wait(), self.guild_event_timeout)
             except asyncio.TimeoutError:
@@ -467,10 +524,6 @@ class Snake(
                 break
             self._guild_event.clear()
 
-            if len(self.cache.guild_cache) == len(expected_guilds):
-                # all guilds cached
-                break
-
         # cache slash commands
         await self._init_interactions()
 
@@ -504,23 +557,31 @@ class Snake(
         Args:
             event: The event to be dispatched.
         """
-        log.debug(f"Dispatching Event: {event.resolved_name}")
-        listeners = self.listeners.get(event.resolved_name, [])
-        for _listen in listeners:
+        event_name = event.resolved_name
+        listeners = self.listeners.get(event_name)
+        _waits = self.waits.get(event_name)
+        if not listeners and not _waits:
+            # nothing is interested in this event
+            return
+
+        log.debug("Dispatching Event: %s", event_name)
+
+        if listeners:
+            if len(event.__attrs_attrs__) == 1:
+                # this event carries no data, so its listeners take no arguments
+                args, kwargs = (), {}
+            else:
+                args = (event, *args)
+
             try:
-                self._queue_task(_listen, event, *args, **kwargs)
+                for _listen in listeners:
+                    self._queue_task(_listen, event, *args, **kwargs)
             except Exception as e:
-                raise BotException(f"An error occurred attempting during {event.resolved_name} event processing")
+                raise BotException(f"An error occurred attempting during {event_name} event processing")
 
-        _waits = self.waits.get(event.resolved_name, [])
-        index_to_remove = []
-        for i, _wait in enumerate(_waits):
-            result = _wait(event)
-            if result:
-                index_to_remove.append(i)
-
-        for idx in index_to_remove:
-            _waits.pop(idx)
+        if _waits:
+            # rebuild the list in a single pass, dropping any waits that have been resolved
+            self.waits[event_name] = [_wait for _wait in _waits if not _wait(event)]
 
     def wait_for(self, event: str, checks: Optional[Callable[..., bool]] = MISSING, timeout: Optional[float] = None):
         """
@@ -534,11 +595,8 @@ class Snake(
         Returns:
             The event object.
         """
-        if event not in self.waits:
-            self.waits[event] = []
-
         future = self.loop.create_future()
-        self.waits[event].append(Wait(event, checks, future))
+        self.waits.setdefault(sys.intern(event), []).append(Wait(event, checks, future))
 
         return asyncio.wait_for(future, timeout)
 
@@ -567,20 +625,21 @@ class Snake(
             raise ValueError("You must specify messages or components (or both)")
 
         message_ids = (
-            to_snowflake_list(messages) if isinstance(messages, list) else to_snowflake(messages) if messages else None
+            frozenset(to_snowflake_list(messages) if isinstance(messages, list) else (to_snowflake(messages),))
+            if messages
+            else None
         )
-        custom_ids = list(get_components_ids(components)) if components else None
-
         # automatically convert improper custom_ids
-        if custom_ids and not all(isinstance(x, str) for x in custom_ids):
-            custom_ids = [str(i) for i in custom_ids]
+        custom_ids = (
+            frozenset(x if isinstance(x, str) else str(x) for x in get_components_ids(components))
+            if components
+            else None
+        )
 
         def _check(event: Component):
             ctx: ComponentContext = event.context
             # if custom_ids is empty or there is a match
-            wanted_message = not message_ids or ctx.message.id in (
-                [message_ids] if isinstance(message_ids, int) else message_ids
-            )
+            wanted_message = not message_ids or ctx.message.id in message_ids
             wanted_component = not custom_ids or ctx.custom_id in custom_ids
             if wanted_message and wanted_component:
                 if check is None or check(event):
@@ -597,9 +656,10 @@ class Snake(
         Args:
             coro Listener: The listener to add to the client
         """
-        if listener.event not in self.listeners:
-            self.listeners[listener.event] = []
-        self.listeners[listener.event].append(listener)
+        # event names are interned to match `BaseEvent.resolved_name`, letting dispatch lookups compare by identity
+        event = sys.intern(listener.event)
+        # listeners are stored as tuples, and replaced rather than mutated, so dispatch can iterate them safely
+        self.listeners[event] = self.listeners.get(event, ()) + (listener,)
 
     def add_interaction(self, command: InteractionCommand):
         """
@@ -611,17 +671,15 @@ class Snake(
         if self.debug_scope:
             command.scopes = [self.debug_scope]
         for scope in command.scopes:
+            scope_cmds = self.interactions.setdefault(scope, {})
 
-            if scope not in self.interactions:
-                self.interactions[scope] = {}
-            elif command.resolved_name in self.interactions[scope]:
-                old_cmd = self.interactions[scope][command.resolved_name]
+            if old_cmd := scope_cmds.get(command.resolved_name):
                 raise ValueError(f"Duplicate Command! {scope}::{old_cmd.resolved_name}")
 
             if self.enforce_interaction_perms:
                 command.checks.append(command._permission_enforcer)  # noqa
 
-            self.interactions[scope][command.resolved_name] = command
+            scope_cmds[command.resolved_name] = command
 
     def add_message_command(self, command: MessageCommand):
         """
@@ -643,10 +701,7 @@ class Snake(
         """
         for listener in command.listeners:
             # I know this isn't an ideal solution, but it means we can lookup callbacks with O(1)
-            if listener not in self._component_callbacks.keys():
-                self._component_callbacks[listener] = command
-                continue
-            else:
+            if self._component_callbacks.setdefault(listener, command) is not command:
                 raise ValueError(f"Duplicate Component! Multiple component callbacks for `{listener}`")
 
     def _gather_commands(self):
@@ -669,11 +724,27 @@ class Snake(
         process(
             [obj for _, obj in inspect.getmembers(sys.modules["__main__"]) if isinstance(obj, (BaseCommand, Listener))]
         )
-        process(
-            [wrap_partial(obj, self) for _, obj in inspect.getmembers(self) if isinstance(obj, (BaseCommand, Listener))]
-        )
+        members = self._get_class_members()
+        process([wrap_partial(obj, self) for obj in members if isinstance(obj, (BaseCommand, Listener))])
+
+        for obj in members:
+            if isinstance(obj, Task):
+                self._tasks.append(wrap_partial(obj, self))
 
-        [wrap_partial(obj, self) for _, obj in inspect.getmembers(self) if isinstance(obj, Task)]
+    def _get_class_members(self) -> list:
+        """
+        Get the attributes defined on this client's class and its bases.
+
+        Unlike `inspect.getmembers`, this reads the class dicts directly, so properties are never evaluated.
+
+        Returns:
+            A list of attribute values, with subclass definitions taking precedence over their bases
+        """
+        members = {}
+        for cls in type(self).__mro__:
+            for name, val in cls.__dict__.items():
+                members.setdefault(name, val)
+        return list(members.values())
 
     async def _init_interactions(self) -> None:
         """
@@ -691,22 +762,44 @@ class Snake(
         except Exception as e:
             await self.on_error("Interaction Syncing", e)
 
+    async def _get_interaction_elements(self, scopes: List["Snowflake_Type"], max_concurrency: int = 10) -> list:
+        """
+        Get the interactions registered with discord for several scopes concurrently.
+
+        Args:
+            scopes: The scopes to get interactions for
+            max_concurrency: The maximum number of requests to have in flight at once
+
+        Returns:
+            A list of results in the same order as `scopes`. A request that failed is represented by its exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _get(scope):
+            async with semaphore:
+                return await self.http.get_interaction_element(self.user.id, scope)
+
+        return await asyncio.gather(*(_get(scope) for scope in scopes), return_exceptions=True)
+
     async def _cache_interactions(self, warn_missing: bool = False):
         """Get all interactions used by this bot and cache them."""
         bot_scopes = set(g.id for g in self.cache.guild_cache.values())
         bot_scopes.add(GLOBAL_SCOPE)
 
+        scopes = list(self.interactions)
+        bot_scopes.difference_update(scopes)
+
         # Match all interaction is registered with discord's data.
-        for scope in self.interactions:
-            bot_scopes.discard(scope)
-            try:
-                remote_cmds = await self.http.get_interaction_element(self.user.id, scope)
-            except Forbidden as e:
-                raise InteractionMissingAccess(scope) from None
+        for scope, remote_cmds in zip(scopes, await self._get_interaction_elements(scopes)):
+            if isinstance(remote_cmds, BaseException):
+                if isinstance(remote_cmds, Forbidden):
+                    raise InteractionMissingAccess(scope) from None
+                raise remote_cmds
+            scope_cmds = self.interactions[scope]
 
             remote_cmds = {cmd_data["name"]: cmd_data for cmd_data in remote_cmds}
             found = set()  # this is a temporary hack to fix subcommand detection
-            for cmd in self.interactions[scope].values():
+            for cmd in scope_cmds.values():
                 cmd_data = remote_cmds.get(cmd.name, MISSING)
                 if cmd_data is MISSING:
                     if cmd.name not in found:
@@ -719,7 +812,7 @@ class Snake(
                 else:
                     found.add(cmd.name)
 
-                self._interaction_scopes[str(cmd_data["id"])] = scope
+                self._interaction_lookup[str(cmd_data["id"])] = (scope, scope_cmds)
                 cmd.cmd_id = str(cmd_data["id"])
 
             if warn_missing:
@@ -730,16 +823,16 @@ class Snake(
                     )
 
         # Remaining guilds that bot is in but, no interaction is registered
-        for scope in bot_scopes:
-            try:
-                remote_cmds = await self.http.get_interaction_element(self.user.id, scope)
-            except Forbidden:
-                # We will just assume they don't want application commands in this guild.
-                log.debug(f"Bot was not invited to guild {scope} with `application.commands` scope")
-                continue
+        bot_scopes = list(bot_scopes)
+        for scope, remote_cmds in zip(bot_scopes, await self._get_interaction_elements(bot_scopes)):
+            if isinstance(remote_cmds, BaseException):
+                if isinstance(remote_cmds, Forbidden):
+                    # We will just assume they don't want application commands in this guild.
+                    log.debug(f"Bot was not invited to guild {scope} with `application.commands` scope")
+                    continue
+                raise remote_cmds
 
             for cmd_data in remote_cmds:
-                self._interaction_scopes[str(cmd_data["id"])] = scope
                 if warn_missing:
                     log.error(
                         f"Detected unimplemented slash command \"/{cmd_data['name']}\" for scope "
@@ -757,91 +850,145 @@ class Snake(
         cmd_scopes = [to_snowflake(g_id) for g_id in self._user._guild_ids] + [GLOBAL_SCOPE]
 
         guild_perms = {}
+        cmds_to_upload = {}  # {scope: [cmd_json]}
+        unused_cmds = {}  # {scope: [remote_cmd]}
+        scope_cmd_ids = {}  # {scope: {cmd_name: cmd_id}}, as registered with discord in that scope
 
         cmds_json = application_commands_to_dict(self.interactions)
+        cmds_json_by_name = {scope: {c["name"]: c for c in cmds} for scope, cmds in cmds_json.items()}
+
+        for cmd_scope, cmds_resp_data in zip(cmd_scopes, await self._get_interaction_elements(cmd_scopes)):
+            if isinstance(cmds_resp_data, BaseException):
+                if isinstance(cmds_resp_data, Forbidden):
+                    raise InteractionMissingAccess(cmd_scope) from None
+                raise cmds_resp_data
+
+            remote_cmds_by_id = {c["id"]: c for c in cmds_resp_data}
+            scope_cmd_ids[cmd_scope] = {c["name"]: str(c["id"]) for c in cmds_resp_data}
+            need_to_sync = False
+            cmds_to_sync = []
+            found = set()  # ids of remote commands that are still registered locally
+
+            scope_cmds = self.interactions.get(cmd_scope)
+            scope_cmds_json = cmds_json_by_name.get(cmd_scope)
+            for local_cmd in scope_cmds.values() if scope_cmds else ():
+                # try and find remote equiv of this command
+                remote_cmd = remote_cmds_by_id.get(local_cmd.cmd_id)
+
+                local_cmd = scope_cmds_json[local_cmd.name]
+
+                if local_cmd not in cmds_to_sync:
+                    cmds_to_sync.append(local_cmd)
+                if remote_cmd is not None:
+                    found.add(remote_cmd["id"])
+
+                # todo: prevent un-needed syncs for subcommands
+                if sync_needed(local_cmd, remote_cmd):
+                    # if command local data doesnt match remote, a change has been made, sync it
+                    need_to_sync = True
+
+            if need_to_sync:
+                cmds_to_upload[cmd_scope] = cmds_to_sync
+            else:
+                log.debug(f"{cmd_scope} is already up-to-date with {len(cmds_resp_data)} commands.")
 
-        for cmd_scope in cmd_scopes:
-            try:
-                cmds_resp_data = await self.http.get_interaction_element(self.user.id, cmd_scope)
-                need_to_sync = False
-                cmds_to_sync = []
-                found = []
-
-                for local_cmd in self.interactions.get(cmd_scope, {}).values():
-                    # try and find remote equiv of this command
-                    remote_cmd = next((v for v in cmds_resp_data if v["id"] == local_cmd.cmd_id), None)
-
-                    local_cmd = next((c for c in cmds_json[cmd_scope] if c["name"] == local_cmd.name))
-
-                    if local_cmd not in cmds_to_sync:
-                        cmds_to_sync.append(local_cmd)
-                    if remote_cmd not in found:
-                        found.append(remote_cmd)
-
-                    # todo: prevent un-needed syncs for subcommands
-                    if sync_needed(local_cmd, remote_cmd):
-                        # if command local data doesnt match remote, a change has been made, sync it
-                        need_to_sync = True
-
-                if need_to_sync:
-                    log.info(f"Updating {len(cmds_to_sync)} commands in {cmd_scope}")
-                    cmd_sync_resp = await self.http.post_interaction_element(
-                        self.user.id, cmds_to_sync, guild_id=cmd_scope
-                    )
-                    # cache cmd_ids and their scopes
-                    for cmd_data in cmd_sync_resp:
-                        self._interaction_scopes[cmd_data["id"]] = cmd_scope
-                        if cmd_data["name"] in self.interactions[cmd_scope]:
-                            self.interactions[cmd_scope][cmd_data["name"]].cmd_id = str(cmd_data["id"])
-                        else:
-                            # sub_cmd
-                            for sc in cmd_data["options"]:
-                                if sc["type"] == OptionTypes.SUB_COMMAND:
-                                    if f"{cmd_data['name']} {sc['name']}" in self.interactions[cmd_scope]:
-                                        self.interactions[cmd_scope][f"{cmd_data['name']} {sc['name']}"].cmd_id = str(
-                                            cmd_data["id"]
-                                        )
-                                elif sc["type"] == OptionTypes.SUB_COMMAND_GROUP:
-                                    for _sc in sc["options"]:
-                                        if (
-                                            f"{cmd_data['name']} {sc['name']} {_sc['name']}"
-                                            in self.interactions[cmd_scope]
-                                        ):
-                                            self.interactions[cmd_scope][
-                                                f"{cmd_data['name']} {sc['name']} {_sc['name']}"
-                                            ].cmd_id = str(cmd_data["id"])
+            if self.del_unused_app_cmd:
+                unused_cmds[cmd_scope] = [c for c in cmds_resp_data if c["id"] not in found]
 
-                else:
-                    log.debug(f"{cmd_scope} is already up-to-date with {len(cmds_resp_data)} commands.")
+        # upload every changed scope at once, rather than waiting on each in turn
+        semaphore = asyncio.Semaphore(5)
 
-                for local_cmd in self.interactions.get(cmd_scope, {}).values():
-                    if not local_cmd.permissions:
-                        continue
-                    for perm in local_cmd.permissions:
-                        if perm.guild_id not in guild_perms:
-                            guild_perms[perm.guild_id] = []
-                        guild_perms[perm.guild_id].append(
-                            {"id": local_cmd.cmd_id, "permissions": [perm.to_dict() for perm in local_cmd.permissions]}
-                        )
-
-                for perm_scope in guild_perms:
-                    log.debug(f"Updating {len(guild_perms[perm_scope])} command permissions in {perm_scope}")
-                    await self.http.batch_edit_application_command_permissions(
-                        application_id=self.user.id, scope=perm_scope, data=guild_perms[perm_scope]
+        async def _upload(scope, cmds):
+            async with semaphore:
+                log.info(f"Updating {len(cmds)} commands in {scope}")
+                return await self.http.post_interaction_element(self.user.id, cmds, guild_id=scope)
+
+        upload_responses = await asyncio.gather(
+            *(_upload(scope, cmds) for scope, cmds in cmds_to_upload.items()), return_exceptions=True
+        )
+
+        # responses are processed in scope order, so commands shared between scopes end up with a predictable cmd_id
+        failed_upload = None
+        for cmd_scope, cmd_sync_resp in zip(cmds_to_upload, upload_responses):
+            if isinstance(cmd_sync_resp, BaseException):
+                log.error(f"Failed to update commands in {cmd_scope}: {cmd_sync_resp!r}")
+                if failed_upload is None:
+                    failed_upload = (
+                        InteractionMissingAccess(cmd_scope) if isinstance(cmd_sync_resp, Forbidden) else cmd_sync_resp
                     )
+                continue
 
-                if self.del_unused_app_cmd:
-                    for cmd in [c for c in cmds_resp_data if c not in found]:
-                        scope = cmd.get("guild_id", GLOBAL_SCOPE)
-                        log.warning(
-                            f"Deleting unimplemented slash command \"/{cmd['name']}\" from scope "
-                            f"{'global' if scope == GLOBAL_SCOPE else scope}"
-                        )
-                        await self.http.delete_interaction_element(
-                            self.user.id, cmd.get("guild_id", GLOBAL_SCOPE), cmd["id"]
-                        )
-            except Forbidden as e:
-                raise InteractionMissingAccess(cmd_scope) from None
+            scope_map = self.interactions[cmd_scope]
+            # the upload replaces every command in the scope, so its response holds the scope's ids
+            cmd_ids = scope_cmd_ids[cmd_scope] = {}
+            # the base names of any subcommands in this scope, so only those responses are searched for subcommands
+            sub_cmd_bases = {name.split(" ", 1)[0] for name in scope_map if " " in name}
+
+            # cache cmd_ids and their scopes
+            for cmd_data in cmd_sync_resp:
+                name = cmd_data["name"]
+                cmd_id = str(cmd_data["id"])
+                cmd_ids[name] = cmd_id
+                self._interaction_lookup[cmd_id] = (cmd_scope, scope_map)
+
+                if (cmd := scope_map.get(name)) is not None:
+                    cmd.cmd_id = cmd_id
+                elif name in sub_cmd_bases:
+                    # sub_cmd
+                    for sc in cmd_data["options"]:
+                        if sc["type"] == OptionTypes.SUB_COMMAND:
+                            if (cmd := scope_map.get(f"{name} {sc['name']}")) is not None:
+                                cmd.cmd_id = cmd_id
+                        elif sc["type"] == OptionTypes.SUB_COMMAND_GROUP:
+                            for _sc in sc["options"]:
+                                if (cmd := scope_map.get(f"{name} {sc['name']} {_sc['name']}")) is not None:
+                                    cmd.cmd_id = cmd_id
+
+        if failed_upload is not None:
+            raise failed_upload
+
+        # a command shared between scopes has a different cmd_id in each, and local_cmd.cmd_id only holds one of
+        # them, so each guild's permissions use the id registered in that guild (or globally, for global commands)
+        perm_cmd_ids = set()  # (guild_id, cmd_id) pairs that already have an entry
+        for cmd_scope in cmd_scopes:
+            if not (scope_cmds := self.interactions.get(cmd_scope)):
+                continue
+            cmd_ids = scope_cmd_ids.get(cmd_scope, {})
+            for local_cmd in scope_cmds.values():
+                if not local_cmd.permissions or (cmd_id := cmd_ids.get(local_cmd.name)) is None:
+                    continue
+                perms_by_guild = {}
+                for perm in local_cmd.permissions:
+                    perms_by_guild.setdefault(perm.guild_id, []).append(perm.to_dict())
+                for guild_id, perm_dicts in perms_by_guild.items():
+                    if cmd_scope != GLOBAL_SCOPE and guild_id != cmd_scope:
+                        # this registration doesn't exist in that guild
+                        continue
+                    if (guild_id, cmd_id) in perm_cmd_ids:
+                        continue
+                    perm_cmd_ids.add((guild_id, cmd_id))
+                    guild_perms.setdefault(guild_id, []).append({"id": cmd_id, "permissions": perm_dicts})
+
+        for perm_scope, perms in guild_perms.items():
+            log.debug(f"Updating {len(perms)} command permissions in {perm_scope}")
+            try:
+                await self.http.batch_edit_application_command_permissions(
+                    application_id=self.user.id, scope=perm_scope, data=perms
+                )
+            except Forbidden:
+                raise InteractionMissingAccess(perm_scope) from None
+
+        for cmd_scope, cmds in unused_cmds.items():
+            for cmd in cmds:
+                scope = cmd.get("guild_id", GLOBAL_SCOPE)
+                log.warning(
+                    f"Deleting unimplemented slash command \"/{cmd['name']}\" from scope "
+                    f"{'global' if scope == GLOBAL_SCOPE else scope}"
+                )
+                try:
+                    await self.http.delete_interaction_element(self.user.id, scope, cmd["id"])
+                except Forbidden:
+                    raise InteractionMissingAccess(cmd_scope) from None
 
     async def get_context(
         self, data: Union[dict, Message], interaction: bool = False
@@ -876,45 +1023,33 @@ class Snake(
 
             if options := data["data"].get("options"):
                 o_type = options[0]["type"]
-                if o_type in (OptionTypes.SUB_COMMAND, OptionTypes.SUB_COMMAND_GROUP):
+                if o_type in _sub_command_types:
                     # this is a subcommand, process accordingly
                     if o_type == OptionTypes.SUB_COMMAND:
                         invoked_name = f"{invoked_name} {options[0]['name']}"
                         options = options[0].get("options", [])
                     else:
-                        invoked_name = (
-                            f"{invoked_name} {options[0]['name']} "
-                            f"{next(x for x in options[0]['options'] if x['type'] == OptionTypes.SUB_COMMAND)['name']}"
-                        )
-                        options = options[0]["options"][0].get("options", [])
+                        sub = next(x for x in options[0]["options"] if x["type"] == OptionTypes.SUB_COMMAND)
+                        invoked_name = f"{invoked_name} {options[0]['name']} {sub['name']}"
+                        options = sub.get("options", [])
 
+                cache = self.cache
+                guild_id = to_snowflake(data.get("guild_id", 0))
                 for option in options:
                     value = option.get("value")
 
-                    # todo change to match statement
-                    # this block here resolves the options using the cache
-                    if option["type"] == OptionTypes.USER:
-                        value = (
-                            self.cache.member_cache.get((to_snowflake(data.get("guild_id", 0)), to_snowflake(value)))
-                            or self.cache.user_cache.get(to_snowflake(value))
-                        ) or value
-                    elif option["type"] == OptionTypes.CHANNEL:
-                        value = self.cache.channel_cache.get(to_snowflake(value)) or value
-                    elif option["type"] == OptionTypes.ROLE:
-                        value = self.cache.role_cache.get(to_snowflake(value)) or value
-                    elif option["type"] == OptionTypes.MENTIONABLE:
-                        snow = to_snowflake(value)
-                        if user := self.cache.member_cache.get(snow) or self.cache.user_cache.get(snow):
-                            value = user
-                        elif role := self.cache.role_cache.get(snow):
-                            value = role
+                    # resolve the options using the cache
+                    if resolver := _option_resolvers.get(option["type"]):
+                        value = resolver(cache, guild_id, to_snowflake(value)) or value
+                    name = option["name"]
                     if option.get("focused", False):
-                        cls.focussed_option = option.get("name")
-                    kwargs[option["name"].lower()] = value
+                        cls.focussed_option = name
+                    # discord sends option names lower case, so this rarely needs a copy
+                    kwargs[name if name.islower() else name.lower()] = value
 
             cls.invoked_name = invoked_name
             cls.kwargs = kwargs
-            cls.args = [v for v in kwargs.values()]
+            cls.args = list(kwargs.values())
 
             return cls
         else:
@@ -929,21 +1064,20 @@ class Snake(
             raw interaction event
         """
         interaction_data = event.data
+        interaction_type = interaction_data["type"]
+        data = interaction_data.get("data")
 
-        if interaction_data["type"] in (
-            InteractionTypes.PING,
-            InteractionTypes.APPLICATION_COMMAND,
-            InteractionTypes.AUTOCOMPLETE,
-        ):
-            interaction_id = interaction_data["data"]["id"]
-            name = interaction_data["data"]["name"]
-            scope = self._interaction_scopes.get(str(interaction_id))
+        if interaction_type in _command_interaction_types:
+            interaction_id = data["id"]
+            name = data["name"]
+            lookup = self._interaction_lookup.get(interaction_id)
 
-            if scope in self.interactions:
+            if lookup is not None:
+                scope, scope_cmds = lookup
                 ctx = await self.get_context(interaction_data, True)
 
-                command: SlashCommand = self.interactions[scope][ctx.invoked_name]  # type: ignore
-                log.debug(f"{scope} :: {command.name} should be called")
+                command: SlashCommand = scope_cmds[ctx.invoked_name]  # type: ignore
+                log.debug("%s :: %s should be called", scope, command.name)
 
                 if auto_opt := getattr(ctx, "focussed_option", None):
                     try:
@@ -962,10 +1096,10 @@ class Snake(
             else:
                 log.error(f"Unknown cmd_id received:: {interaction_id} ({name})")
 
-        elif interaction_data["type"] == InteractionTypes.MESSAGE_COMPONENT:
+        elif interaction_type == InteractionTypes.MESSAGE_COMPONENT:
             # Buttons, Selects, ContextMenu::Message
             ctx = await self.get_context(interaction_data, True)
-            component_type = interaction_data["data"]["component_type"]
+            component_type = data["component_type"]
 
             self.dispatch(events.Component(ctx))
             if callback := self._component_callbacks.get(ctx.custom_id):
@@ -981,37 +1115,53 @@ class Snake(
                 self.dispatch(events.Select(ctx))
 
         else:
-            raise NotImplementedError(f"Unknown Interaction Received: {interaction_data['type']}")
+            raise NotImplementedError(f"Unknown Interaction Received: {interaction_type}")
 
     @listen("message_create")
     async def _dispatch_msg_commands(self, event: MessageCreate):
         """Determine if a command is being triggered, and dispatch it."""
         message = event.message
 
-        if not message.author.bot:
+        if message.author.bot:
+            return
+
+        content = message.content
+        if getattr(self.get_prefix, "__func__", None) is Snake.get_prefix:
+            # get_prefix hasn't been replaced, so skip awaiting a coroutine that only returns the default
+            prefix = self.default_prefix
+        else:
             prefix = await self.get_prefix(message)
 
-            if prefix == MENTION_PREFIX:
-                mention = self._mention_reg.search(message.content)
-                if mention:
-                    prefix = mention.group()
-                else:
-                    return
-
-            if message.content.startswith(prefix):
-                invoked_name = get_first_word(message.content.removeprefix(prefix))
-                command = self.commands.get(invoked_name)
-                if command and command.enabled:
-                    context = await self.get_context(message)
-                    context.invoked_name = invoked_name
-                    context.prefix = prefix
-                    context.args = get_args(context.content_parameters)
-                    try:
-                        await command(context)
-                    except Exception as e:
-                        await self.on_command_error(f"cmd `{invoked_name}`", e)
-                    finally:
-                        await self.on_command(context)
+        if prefix == MENTION_PREFIX:
+            if not content.startswith(self._mention_prefixes):
+                return
+            for mention in self._mention_prefixes:
+                # a mention prefix must be followed by whitespace
+                end = len(mention)
+                if content.startswith(mention) and content[end : end + 1].isspace():
+                    prefix = content[: end + 1]
+                    break
+            else:
+                return
+
+        if not content.startswith(prefix):
+            return
+
+        invoked_name = get_first_word(content[len(prefix) :])
+        command = self.commands.get(invoked_name)
+        if command is None or not command.enabled:
+            return
+
+        context = await self.get_context(message)
+        context.invoked_name = invoked_name
+        context.prefix = prefix
+        context.args = get_args(context.content_parameters)
+        try:
+            await command(context)
+        except Exception as e:
+            await self.on_command_error(f"cmd `{invoked_name}`", e)
+        finally:
+            await self.on_command(context)
 
     def get_scale(self, name) -> Optional[Scale]:
         """
@@ -1022,12 +1172,10 @@ class Snake(
         Returns:
             Scale or None if no scale is found
         """
-        if name not in self.scales.keys():
-            for scale in self.scales.values():
-                if scale.extension_name == name:
-                    return scale
+        if (scale := self.scales.get(name)) is not None:
+            return scale
 
-        return self.scales.get(name, None)
+        return self._scales_by_extension.get(name)
 
     def grow_scale(self, file_name: str, package: str = None) -> None:
         """
@@ -1069,7 +1217,7 @@ class Snake(
             name: The name of the extension.
             package: The package the extension is in
         """
-        name = importlib.util.resolve_name(name, package)
+        name = _resolve_extension_name(name, package)
         if name in self.__extensions:
             raise Exception(f"{name} already loaded")
 
@@ -1094,7 +1242,7 @@ class Snake(
             name: The name of the extension.
             package: The package the extension is in
         """
-        name = importlib.util.resolve_name(name, package)
+        name = _resolve_extension_name(name, package)
         module = self.__extensions.get(name)
 
         if module is None:
@@ -1121,15 +1269,16 @@ class Snake(
             name: The name of the extension.
             package: The package the extension is in
         """
-        name = importlib.util.resolve_name(name, package)
+        name = _resolve_extension_name(name, package)
         module = self.__extensions.get(name)
 
         if module is None:
             log.warning("Attempted to reload extension thats not loaded. Loading extension instead")
-            return self.load_extension(name, package)
+            return self.load_extension(name)
 
-        self.unload_extension(name, package)
-        self.load_extension(name, package)
+        # name is now absolute, so the package isn't needed to resolve it again
+        self.unload_extension(name)
+        self.load_extension(name)
 
         # todo: maybe add an ability to revert to the previous version if unable to load the new one
 
@@ -1231,16 +1380,17 @@ class Snake(
                 if not activity.url:
                     log.warning("Streaming activity cannot be set without a valid URL attribute")
             elif activity.type not in [ActivityType.GAME, ActivityType.STREAMING, ActivityType.LISTENING]:
-                log.warning(f"Activity type `{ActivityType(activity.type).name}` may not be enabled for bots")
+                if log.isEnabledFor(logging.WARNING):
+                    log.warning(f"Activity type `{ActivityType(activity.type).name}` may not be enabled for bots")
         else:
             activity = self._activity if self._activity else []
 
         if status:
             if not isinstance(status, Status):
-                try:
-                    status = Status[status.upper()]
-                except KeyError:
-                    raise ValueError(f"`{status}` is not a valid status type. Please use the Status enum") from None
+                status_enum = _status_by_name.get(status.upper()) if isinstance(status, str) else None
+                if status_enum is None:
+                    raise ValueError(f"`{status}` is not a valid status type. Please use the Status enum")
+                status = status_enum
         else:
             # in case the user set status to None
             if self._status:
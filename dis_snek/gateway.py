@@ -3,6 +3,7 @@ This file outlines the interaction between snek and Discord's Gateway API.
 """
 import asyncio
 import concurrent.futures
+import functools
 import logging
 import random
 import sys
@@ -25,6 +26,12 @@ from dis_snek.utils.serializer import dict_filter_none
 log = logging.getLogger(logger_name)
 
 
+@functools.lru_cache(maxsize=None)
+def _raw_event_name(event_type: str) -> str:
+    """Get the name a gateway event is dispatched under, i.e. `MESSAGE_CREATE` -> `raw_message_create`"""
+    return sys.intern(f"raw_{event_type.lower()}")
+
+
 class BeeGees(threading.Thread):
     """
     Keeps the gateway connection alive.
@@ -298,7 +305,7 @@ class WebsocketClient:
                 return
             else:
                 self.dispatch(events.RawGatewayEvent(msg, override_name="raw_socket_receive"))
-            self.dispatch(events.RawGatewayEvent(data, override_name=f"raw_{msg.get('t').lower()}"))
+            self.dispatch(events.RawGatewayEvent(data, override_name=_raw_event_name(msg.get("t"))))
 
     async def run(self) -> None:
         """Start receiving events from the websocket."""
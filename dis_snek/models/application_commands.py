@@ -743,26 +743,29 @@ def application_commands_to_dict(commands: Dict["Snowflake_Type", Dict[str, Inte
     return output
 
 
-def _compare_options(local_opt_list: dict, remote_opt_list: dict):
-    if local_opt_list != remote_opt_list:
-        if len(local_opt_list) != len(remote_opt_list):
-            return False
-        for i in range(len(local_opt_list)):
-            local_option = local_opt_list[i]
-            remote_option = remote_opt_list[i]
-            if local_option["type"] == remote_option["type"]:
-                if local_option["type"] in (OptionTypes.SUB_COMMAND_GROUP, OptionTypes.SUB_COMMAND):
-                    if not _compare_options(local_option["options"], remote_option["options"]):
-                        return False
-                else:
-                    if (
-                        local_option["name"] != remote_option["name"]
-                        or local_option["description"] != remote_option["description"]
-                        or local_option["required"] != remote_option.get("required", False)
-                        or local_option["autocomplete"] != remote_option.get("autocomplete", False)
-                    ):
-                        return False
-    return True
+def _options_signature(options: List[dict]) -> tuple:
+    """
+    Reduce a list of option dicts to a tuple of the fields that determine if a sync is required.
+
+    Missing keys are filled with discord's defaults, so local and remote representations can be compared with `==`
+    """
+    signature = []
+    for option in options:
+        if option["type"] in (OptionTypes.SUB_COMMAND_GROUP, OptionTypes.SUB_COMMAND):
+            signature.append(
+                (option["type"], option["name"], option["description"], _options_signature(option.get("options", [])))
+            )
+        else:
+            signature.append(
+                (
+                    option["type"],
+                    option["name"],
+                    option["description"],
+                    option.get("required", False),
+                    option.get("autocomplete", False),
+                )
+            )
+    return tuple(signature)
 
 
 def sync_needed(local_cmd: dict, remote_cmd: Optional[dict] = None) -> bool:
@@ -789,12 +792,8 @@ def sync_needed(local_cmd: dict, remote_cmd: Optional[dict] = None) -> bool:
         return True
 
     if remote_cmd["type"] == CommandTypes.CHAT_INPUT:
-        try:
-            if not _compare_options(local_cmd["options"], remote_cmd["options"]):
-                # options are not the same, sync needed
-                return True
-        except KeyError:
-            if "options" in local_cmd or "options" in remote_cmd:
-                return True
+        if _options_signature(local_cmd.get("options", [])) != _options_signature(remote_cmd.get("options", [])):
+            # options are not the same, sync needed
+            return True
 
     return False
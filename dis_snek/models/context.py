@@ -75,6 +75,7 @@ class Resolved:
 class Context:
     """Represents the context of a command"""
 
+    _log_symbol = "?"  # the symbol used when logging this context's invocation, likely a custom context
     _client: "Snake" = attr.ib(default=None)
     invoked_name: str = attr.ib(default=None, metadata=docs("The name of the command to be invoked"))
 
@@ -157,6 +158,8 @@ class InteractionContext(_BaseInteractionContext, SendMixin):
         you will be able to edit it when responding to a button interaction.
     """
 
+    _log_symbol = "/"
+
     @property
     def guild(self):
         return self._client.cache.guild_cache.get(self.guild_id)
@@ -239,6 +242,8 @@ class InteractionContext(_BaseInteractionContext, SendMixin):
 
 @define
 class ComponentContext(InteractionContext):
+    _log_symbol = "¢"
+
     custom_id: str = attr.ib(default="", metadata=docs("The ID given to the component that has been pressed"))
     component_type: int = attr.ib(default=0, metadata=docs("The type of component that has been pressed"))
 
@@ -343,6 +348,8 @@ class ComponentContext(InteractionContext):
 
 @define
 class AutocompleteContext(_BaseInteractionContext):
+    _log_symbol = "$"
+
     focussed_option: str = attr.ib(default=MISSING, metadata=docs("The option the user is currently filling in"))
 
     @classmethod
@@ -390,6 +397,8 @@ class AutocompleteContext(_BaseInteractionContext):
 
 @define
 class MessageContext(Context, SendMixin):
+    _log_symbol = "@"
+
     prefix: str = attr.ib(default=MISSING, metadata=docs("The prefix used to invoke this command"))
 
     @classmethod
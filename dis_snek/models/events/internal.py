@@ -18,7 +18,9 @@
 !!! warning
     While all of these events are documented, not all of them are used, currently.
 """
+import functools
 import re
+import sys
 from typing import TYPE_CHECKING
 
 import attr
@@ -33,6 +35,12 @@ if TYPE_CHECKING:
 _event_reg = re.compile("(?<!^)(?=[A-Z])")
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_event_name(name: str) -> str:
+    """Convert an event's class name to its snake_case event name, interned so dict lookups can compare by identity"""
+    return sys.intern(_event_reg.sub("_", name).lower())
+
+
 @attr.s()
 class BaseEvent:
     """A base event that all other events inherit from"""
@@ -41,8 +49,7 @@ class BaseEvent:
 
     @property
     def resolved_name(self):
-        name = self.override_name or self.__class__.__name__
-        return _event_reg.sub("_", name).lower()
+        return _resolve_event_name(self.override_name or self.__class__.__name__)
 
 
 @attr.s()
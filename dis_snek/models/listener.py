@@ -5,6 +5,10 @@ from dis_snek.const import MISSING
 
 
 class Listener:
+    __slots__ = "event", "callback"
+    event: str
+    callback: Callable[..., Coroutine]
+
     def __init__(self, func: Callable[..., Coroutine], event: str):
         self.event = event
         self.callback = func
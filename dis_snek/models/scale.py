@@ -99,7 +99,14 @@ class Scale:
         )
 
         new_cls.extension_name = inspect.getmodule(new_cls).__name__
+        replaced = new_cls.bot.scales.get(new_cls.name)
         new_cls.bot.scales[new_cls.name] = new_cls
+
+        scales_by_extension = new_cls.bot._scales_by_extension
+        if replaced is not None and scales_by_extension.get(replaced.extension_name) is replaced:
+            # don't leave the extension pointing at a scale that is no longer mounted
+            del scales_by_extension[replaced.extension_name]
+        scales_by_extension.setdefault(new_cls.extension_name, new_cls)
         return new_cls
 
     @property
@@ -136,9 +143,16 @@ class Scale:
                 if self.bot.commands[func.name]:
                     self.bot.commands.pop(func.name)
         for func in self.listeners:
-            self.bot.listeners[func.event].remove(func)
+            self.bot.listeners[func.event] = tuple(lis for lis in self.bot.listeners[func.event] if lis is not func)
 
         self.bot.scales.pop(self.name, None)
+        if self.bot._scales_by_extension.get(self.extension_name) is self:
+            del self.bot._scales_by_extension[self.extension_name]
+            # point the extension at any other scale it still has mounted
+            for scale in self.bot.scales.values():
+                if scale.extension_name == self.extension_name:
+                    self.bot._scales_by_extension[self.extension_name] = scale
+                    break
         log.debug(f"{self.name} has been shed")
 
     def add_scale_check(self, coroutine: Callable[..., Coroutine]) -> None:
@@ -3,6 +3,11 @@ from typing import Coroutine, Callable, Optional
 
 
 class Wait:
+    __slots__ = "event", "checks", "future"
+    event: str
+    checks: Optional[Callable[..., bool]]
+    future: Future
+
     def __init__(self, event: str, checks: Optional[Callable[..., bool]], future: Future):
         self.event = event
         self.checks = checks
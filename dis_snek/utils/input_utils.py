@@ -94,10 +94,10 @@ def get_first_word(text: str):
     Returns:
          The requested word
     """
-    found = initial_word.findall(text)
-    if len(found) == 0:
+    found = initial_word.match(text)
+    if found is None:
         return None
-    return found[0]
+    return found.group(1)
 
 
 def _get_mime_type_for_image(data: bytes):